@@ -25,7 +25,7 @@ setup(
     extras_require={
         "interactive": ["inquirer>=3.1.0"],
         "web": [
-            "fastapi>=0.109.0",
+            "fastapi>=0.130.0",
             "uvicorn[standard]>=0.27.0",
             "python-jose[cryptography]>=3.3.0",
             "passlib[bcrypt]>=1.7.4",
@@ -41,7 +41,7 @@ setup(
             "rich>=13.0",
             "psutil>=5.9.0",
             "httpx>=0.25.0",
-            "fastapi>=0.109.0",
+            "fastapi>=0.130.0",
             "uvicorn[standard]>=0.27.0",
             "python-jose[cryptography]>=3.3.0",
             "passlib[bcrypt]>=1.7.4",
@@ -6,11 +6,15 @@ Commands for starting and managing the web dashboard.
 
 import os
 import sys
+import time
+import select
 import signal
+import socket
 import subprocess
 from argparse import Namespace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from wasm.core.logger import Logger
 from wasm.core.exceptions import WASMError
@@ -20,7 +24,18 @@ from wasm.core.exceptions import WASMError
 PID_FILE = Path("/var/run/wasm-web.pid")
 PID_FILE_USER = Path.home() / ".wasm" / "web.pid"
 
+# Seconds to wait for the server to exit after SIGTERM (and again after SIGKILL)
+STOP_TIMEOUT = 10.0
 
+# Seconds to wait for a newly spawned daemon to accept connections, watching
+# for an early exit in the meantime (e.g. missing dependencies)
+DAEMON_STARTUP_TIMEOUT = 10.0
+
+# Seconds between readiness checks while a daemon starts
+DAEMON_STARTUP_POLL_INTERVAL = 0.05
+
+
+@lru_cache(maxsize=1)
 def get_pid_file() -> Path:
     """Get the appropriate PID file path."""
     if os.geteuid() == 0:
@@ -28,6 +43,173 @@ def get_pid_file() -> Path:
     return PID_FILE_USER
 
 
+def _read_pid(path: Path) -> int:
+    """
+    Read a PID from a PID file.
+    
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file does not contain a valid PID.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return int(os.read(fd, 32))
+    finally:
+        os.close(fd)
+
+
+def _pidfd_open(pid: int) -> Optional[int]:
+    """
+    Open a pidfd for a process.
+    
+    A pidfd pins the process, so the PID cannot be recycled while
+    the descriptor is held.
+    
+    Args:
+        pid: Process ID.
+        
+    Returns:
+        The pidfd, or None if pidfd_open is unavailable (kernel < 5.3).
+        
+    Raises:
+        ProcessLookupError: If the process does not exist.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid, 0)
+    except ProcessLookupError:
+        raise
+    except OSError:
+        # ENOSYS on old kernels, EPERM under restrictive seccomp filters
+        return None
+
+
+def _send_signal(pid: int, pidfd: Optional[int], sig: int) -> None:
+    """Send a signal through the pidfd if there is one, else by PID."""
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def _wait_for_exit(pid: int, timeout: float = 5.0, pidfd: Optional[int] = None) -> bool:
+    """
+    Wait for a process to exit.
+    
+    Polls a pidfd so the wait returns as soon as the process exits,
+    falling back to probing with kill(pid, 0) when pidfds are unavailable.
+    
+    Args:
+        pid: Process ID.
+        timeout: Maximum time to wait, in seconds.
+        pidfd: Already open pidfd for the process (left open).
+        
+    Returns:
+        True if the process exited within the timeout.
+    """
+    fd = pidfd
+    if fd is None:
+        try:
+            fd = _pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+    
+    if fd is not None:
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            if pidfd is None:
+                os.close(fd)
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        time.sleep(0.05)
+    return False
+
+
+def _wait_for_child_exit(
+    pid: int,
+    timeout: float,
+    ready: Optional[Callable[[], bool]] = None,
+) -> Optional[int]:
+    """
+    Wait for a child process to exit and reap it.
+    
+    Waits on a pidfd and collects the status with waitid(P_PIDFD), which
+    targets exactly this child rather than any child that exits.
+    
+    Args:
+        pid: Child process ID.
+        timeout: Maximum time to wait, in seconds.
+        ready: Optional check polled while waiting; the wait stops early
+            once it returns True.
+        
+    Returns:
+        The exit code (negative signal number if killed by a signal),
+        or None if the child is still running after the timeout or
+        once ready() returned True.
+    """
+    step = DAEMON_STARTUP_POLL_INTERVAL if ready is not None else timeout
+    deadline = time.monotonic() + timeout
+    
+    fd = _pidfd_open(pid)
+    if fd is None or not hasattr(os, "P_PIDFD"):
+        if fd is not None:
+            os.close(fd)
+        while True:
+            waited_pid, status = os.waitpid(pid, os.WNOHANG)
+            if waited_pid:
+                return os.waitstatus_to_exitcode(status)
+            if ready is not None and ready():
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(0.05, remaining))
+    
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if _wait_for_exit(pid, max(0.0, min(step, remaining)), fd):
+                break
+            if ready is not None and ready():
+                return None
+            if remaining <= step:
+                return None
+        result = os.waitid(os.P_PIDFD, fd, os.WEXITED | os.WNOHANG)
+    finally:
+        os.close(fd)
+    
+    if result is None:
+        return None
+    if result.si_code == os.CLD_EXITED:
+        return result.si_status
+    return -result.si_status
+
+
+def _is_accepting(host: str, port: int) -> bool:
+    """
+    Check whether something accepts TCP connections on host:port.
+    
+    Wildcard addresses are checked on the matching loopback address.
+    """
+    connect_host = {"0.0.0.0": "127.0.0.1", "::": "::1", "": "127.0.0.1"}.get(host, host)
+    try:
+        with socket.create_connection((connect_host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
 def handle_web(args: Namespace) -> int:
     """
     Handle web commands.
@@ -74,7 +256,7 @@ def handle_web(args: Namespace) -> int:
 
 # Mapping from import name to package names (apt, pip)
 WEB_DEPENDENCIES = {
-    "fastapi": ("python3-fastapi", "fastapi>=0.109.0"),
+    "fastapi": ("python3-fastapi", "fastapi>=0.130.0"),
     "uvicorn": ("python3-uvicorn", "uvicorn[standard]>=0.27.0"),
     "jose": ("python3-jose", "python-jose[cryptography]>=3.3.0"),
     "passlib": ("python3-passlib", "passlib[bcrypt]>=1.7.4"),
@@ -83,9 +265,12 @@ WEB_DEPENDENCIES = {
 }
 
 
+@lru_cache(maxsize=1)
 def _check_dependencies() -> tuple[bool, list[str], list[str]]:
     """Check if web dependencies are installed.
     
+    The result is cached; installers clear the cache after installing.
+    
     Returns:
         Tuple of (all_installed, missing_apt_packages, missing_pip_packages)
     """
@@ -96,7 +281,7 @@ def _check_dependencies() -> tuple[bool, list[str], list[str]]:
         import fastapi
     except ImportError:
         missing_apt.append("python3-fastapi")
-        missing_pip.append("fastapi>=0.109.0")
+        missing_pip.append("fastapi>=0.130.0")
     
     try:
         import uvicorn
@@ -195,6 +380,7 @@ def _install_with_pip(packages: list[str], verbose: bool = False, force: bool =
             capture_output=not verbose,
             text=True,
         )
+        _check_dependencies.cache_clear()
         
         if result.returncode != 0:
             if not verbose and result.stderr:
@@ -229,6 +415,7 @@ def _install_with_apt(packages: list[str], verbose: bool = False) -> bool:
             capture_output=not verbose,
             text=True,
         )
+        _check_dependencies.cache_clear()
         
         if result.returncode != 0:
             if not verbose and result.stderr:
@@ -333,9 +520,13 @@ def _handle_start(args: Namespace) -> int:
     pid_file = get_pid_file()
     if pid_file.exists():
         try:
-            pid = int(pid_file.read_text().strip())
-            # Check if process exists
-            os.kill(pid, 0)
+            pid = _read_pid(pid_file)
+            # Check if process exists (pidfd pins the PID during the check)
+            fd = _pidfd_open(pid)
+            if fd is None:
+                os.kill(pid, 0)
+            else:
+                os.close(fd)
             logger.warning(f"Web server already running (PID: {pid})")
             logger.info("Use 'wasm web stop' to stop it first")
             return 1
@@ -399,51 +590,80 @@ def _start_daemon(host: str, port: int, verbose: bool) -> int:
     """Start the web server as a daemon."""
     logger = Logger(verbose=verbose)
     
-    # Fork process
-    pid = os.fork()
-    
-    if pid > 0:
-        # Parent process
-        logger.success(f"Web server started in background (PID: {pid})")
-        logger.info(f"Server running at http://{host}:{port}")
-        logger.info("Use 'wasm web status' to check status")
-        logger.info("Use 'wasm web stop' to stop the server")
-        return 0
+    log_file = Path("/var/log/wasm/web.log")
+    if not log_file.parent.exists():
+        log_file = Path.home() / ".wasm" / "web.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Child process
-    os.setsid()
+    # Something else listening there would pass the readiness check below
+    if _is_accepting(host, port):
+        logger.error(f"Port {port} is already in use")
+        return 1
     
-    # Second fork
-    pid = os.fork()
-    if pid > 0:
-        os._exit(0)
+    # Spawn a fresh interpreter in its own session instead of forking this one.
+    # "-c" puts the working directory first on sys.path, so drop it and load
+    # wasm from the same location as this process.
+    package_root = str(Path(__file__).resolve().parents[3])
+    argv = [
+        sys.executable,
+        "-c",
+        "import sys; sys.path[:] = [sys.argv[1]] + [p for p in sys.path if p]; "
+        "from wasm.cli.commands.web import _run_daemon; "
+        "_run_daemon(sys.argv[2], int(sys.argv[3]))",
+        package_root,
+        host,
+        str(port),
+    ]
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 1, str(log_file), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    ]
     
-    # Redirect standard file descriptors
     sys.stdout.flush()
     sys.stderr.flush()
     
-    with open('/dev/null', 'r') as devnull:
-        os.dup2(devnull.fileno(), sys.stdin.fileno())
-    
-    log_file = Path("/var/log/wasm/web.log")
-    if not log_file.parent.exists():
-        log_file = Path.home() / ".wasm" / "web.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(log_file, 'a') as log:
-        os.dup2(log.fileno(), sys.stdout.fileno())
-        os.dup2(log.fileno(), sys.stderr.fileno())
+    pid = os.posix_spawn(
+        sys.executable,
+        argv,
+        os.environ,
+        file_actions=file_actions,
+        setsid=True,
+    )
     
     # Write PID file
     pid_file = get_pid_file()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
-    pid_file.write_text(str(os.getpid()))
+    pid_file.write_text(str(pid))
+    
+    # Return as soon as the server accepts connections, and catch servers
+    # that fail during startup instead of reporting success
+    exit_code = _wait_for_child_exit(
+        pid,
+        DAEMON_STARTUP_TIMEOUT,
+        ready=lambda: _is_accepting(host, port),
+    )
+    if exit_code is not None:
+        pid_file.unlink(missing_ok=True)
+        logger.error(f"Web server exited during startup (exit code: {exit_code})")
+        logger.info(f"See {log_file} for details")
+        return 1
+    
+    logger.success(f"Web server started in background (PID: {pid})")
+    logger.info(f"Server running at http://{host}:{port}")
+    logger.info("Use 'wasm web status' to check status")
+    logger.info("Use 'wasm web stop' to stop the server")
+    return 0
+
+
+def _run_daemon(host: str, port: int) -> None:
+    """Run the web server inside the process spawned by _start_daemon."""
+    from wasm.web.server import run_server
+    from wasm.web.auth import SecurityConfig
+    
+    pid_file = get_pid_file()
     
-    # Start server
     try:
-        from wasm.web.server import run_server
-        from wasm.web.auth import SecurityConfig
-        
         config = SecurityConfig(host=host, port=port)
         if host == '0.0.0.0':
             config.allowed_hosts = []
@@ -451,8 +671,6 @@ def _start_daemon(host: str, port: int, verbose: bool) -> int:
         run_server(host=host, port=port, config=config, show_token=False)
     finally:
         pid_file.unlink(missing_ok=True)
-    
-    os._exit(0)
 
 
 def _handle_stop(args: Namespace) -> int:
@@ -466,10 +684,25 @@ def _handle_stop(args: Namespace) -> int:
         return 0
     
     try:
-        pid = int(pid_file.read_text().strip())
+        pid = _read_pid(pid_file)
+        
+        # Send SIGTERM and wait for the server to exit, escalating to SIGKILL
+        fd = _pidfd_open(pid)
+        try:
+            _send_signal(pid, fd, signal.SIGTERM)
+            if not _wait_for_exit(pid, STOP_TIMEOUT, fd):
+                logger.warning(f"Web server did not exit after {STOP_TIMEOUT:.0f}s, killing it")
+                try:
+                    _send_signal(pid, fd, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                if not _wait_for_exit(pid, STOP_TIMEOUT, fd):
+                    logger.error(f"Web server (PID: {pid}) did not exit")
+                    return 1
+        finally:
+            if fd is not None:
+                os.close(fd)
         
-        # Send SIGTERM
-        os.kill(pid, signal.SIGTERM)
         logger.success(f"Web server stopped (PID: {pid})")
         
         # Remove PID file
@@ -503,7 +736,7 @@ def _handle_status(args: Namespace) -> int:
         return 0
     
     try:
-        pid = int(pid_file.read_text().strip())
+        pid = _read_pid(pid_file)
         
         # Check if process is running
         os.kill(pid, 0)
@@ -537,13 +770,9 @@ def _handle_restart(args: Namespace) -> int:
     
     logger.info("Restarting web server...")
     
-    # Stop first
+    # Stop first (waits for the old server to exit)
     _handle_stop(args)
     
-    # Brief pause
-    import time
-    time.sleep(1)
-    
     # Start again
     return _handle_start(args)
 
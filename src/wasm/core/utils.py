@@ -135,6 +135,8 @@ def run_command_sudo(
 
 
 # Whitelist of trusted installer URLs
+# Exact-match set: str hashes are cached, so lookups stay O(1) as the list grows.
+# Do not key on URL prefixes; the nodesource URLs share a long common prefix.
 TRUSTED_INSTALLER_URLS = frozenset([
     "https://deb.nodesource.com/setup_20.x",
     "https://deb.nodesource.com/setup_22.x",
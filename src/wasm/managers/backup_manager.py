@@ -7,13 +7,19 @@ for deployed web applications.
 
 import hashlib
 import json
+import os
 import shutil
+import sqlite3
 import tarfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Set, Tuple
 
 from wasm.core.config import Config, DEFAULT_APPS_DIR
 from wasm.core.exceptions import WASMError
@@ -139,6 +145,310 @@ class BackupMetadata:
             return "unknown"
 
 
+BACKUP_INDEX_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS backups (
+    id TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    app_name TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    archives INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL,
+    metadata_json TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_backups_app_name ON backups(app_name, created_at);
+CREATE INDEX IF NOT EXISTS idx_backups_domain ON backups(domain);
+"""
+
+
+class BackupIndex:
+    """
+    SQLite index of backup metadata.
+    
+    Lives next to the archives in the backup directory and is updated
+    whenever a backup is created or deleted, so listings and storage
+    totals can be served without walking the backup directory.
+    
+    If the index file is missing (first use, or removed to invalidate it)
+    it is rebuilt from a full scan provided by ``loader``.
+    """
+    
+    FILENAME = ".index.db"
+    
+    # Bumped whenever the schema changes; stored in PRAGMA user_version
+    INDEX_VERSION = 2
+    
+    INSERT_SQL = (
+        "INSERT OR REPLACE INTO backups "
+        "(id, domain, app_name, size, archives, created_at, metadata_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    
+    def __init__(self, db_path: Path, loader: Callable[[], List[BackupMetadata]]):
+        """
+        Initialize the index.
+        
+        Args:
+            db_path: Path to the index database file.
+            loader: Callable returning all backups from a filesystem scan,
+                used to (re)build the index.
+        """
+        self.db_path = Path(db_path)
+        self._loader = loader
+        self._local = threading.local()
+        self._build_lock = threading.Lock()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a thread-local connection, reopening it if the file was replaced."""
+        try:
+            inode = os.stat(self.db_path).st_ino
+        except FileNotFoundError:
+            inode = None
+        
+        conn = getattr(self._local, "connection", None)
+        if conn is not None and inode is not None and inode == self._local.inode:
+            return conn
+        
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+        
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            inode = os.stat(self.db_path).st_ino
+            self._ensure_built(conn)
+        except Exception:
+            # Don't cache a connection to an index that was never built
+            conn.close()
+            raise
+        
+        self._local.connection = conn
+        self._local.inode = inode
+        return conn
+    
+    def _ensure_built(self, conn: sqlite3.Connection) -> None:
+        """Create the schema and populate the index if it has not been built."""
+        with self._build_lock:
+            if self._is_built(conn):
+                return
+            
+            backups = self._loader()
+            
+            # Take the write lock and check again: another process may have
+            # built the index and added backups to it since our scan started
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if not self._is_built(conn):
+                    # Recreate the table, which may have an older schema
+                    conn.execute("DROP TABLE IF EXISTS backups")
+                    for statement in BACKUP_INDEX_SCHEMA_SQL.split(";"):
+                        if statement.strip():
+                            conn.execute(statement)
+                    conn.executemany(self.INSERT_SQL, [self._to_row(b) for b in backups])
+                    conn.execute(f"PRAGMA user_version = {self.INDEX_VERSION}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def _is_built(self, conn: sqlite3.Connection) -> bool:
+        """Check whether the index has been built with the current schema."""
+        return conn.execute("PRAGMA user_version").fetchone()[0] == self.INDEX_VERSION
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Context manager for index transactions."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    @staticmethod
+    def _to_row(metadata: BackupMetadata) -> tuple:
+        """Convert metadata to an index row."""
+        # Docker volume archives are stored next to the backup archive, so
+        # count them with it to match what a directory scan sees
+        volumes = metadata.docker_volume_backups
+        return (
+            metadata.id,
+            metadata.domain,
+            metadata.app_name,
+            metadata.size_bytes + sum(v.get("size_bytes", 0) for v in volumes),
+            1 + len(volumes),
+            metadata.created_at,
+            json.dumps(metadata.to_dict()),
+        )
+    
+    def add(self, metadata: BackupMetadata) -> None:
+        """Add or replace a backup in the index."""
+        with self._transaction() as cursor:
+            cursor.execute(self.INSERT_SQL, self._to_row(metadata))
+    
+    def remove(self, backup_id: str) -> None:
+        """Remove a backup from the index."""
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM backups WHERE id = ?", (backup_id,))
+    
+    def get(self, backup_id: str) -> Optional[BackupMetadata]:
+        """Get a backup by ID."""
+        row = self._get_connection().execute(
+            "SELECT metadata_json FROM backups WHERE id = ?", (backup_id,)
+        ).fetchone()
+        return BackupMetadata.from_dict(json.loads(row["metadata_json"])) if row else None
+    
+    def iter_query(
+        self,
+        app_name: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[BackupMetadata]:
+        """
+        Iterate over backups, newest first.
+        
+        The query runs immediately on a dedicated connection, so errors are
+        raised here and the rows can then be consumed lazily from any thread.
+        
+        Args:
+            app_name: Filter by app name (None for all).
+            limit: Maximum number of backups to return.
+            
+        Returns:
+            Iterator of BackupMetadata objects.
+        """
+        sql = "SELECT metadata_json FROM backups"
+        params: list = []
+        if app_name:
+            sql += " WHERE app_name = ?"
+            params.append(app_name)
+        sql += " ORDER BY created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        # Make sure the index exists and is built before reading from it
+        self._get_connection()
+        
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        try:
+            cursor = conn.execute(sql, params)
+        except Exception:
+            conn.close()
+            raise
+        return self._iter_rows(conn, cursor)
+    
+    @staticmethod
+    def _iter_rows(conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> Iterator[BackupMetadata]:
+        """Yield metadata from query rows, closing the connection when done."""
+        try:
+            for (metadata_json,) in cursor:
+                yield BackupMetadata.from_dict(json.loads(metadata_json))
+        finally:
+            conn.close()
+    
+    def storage_by_app(self) -> List[sqlite3.Row]:
+        """
+        Get backup totals grouped by app backup directory.
+        
+        Returns:
+            Rows with ``app_name``, ``size`` and ``count`` columns, covering
+            each backup archive and its Docker volume archives.
+        """
+        return self._get_connection().execute(
+            "SELECT app_name, SUM(size) AS size, SUM(archives) AS count "
+            "FROM backups GROUP BY app_name"
+        ).fetchall()
+    
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+
+# Worker threads used when scanning backup directories without the index
+STORAGE_SCAN_WORKERS = 8
+
+# Fewer app directories than this are scanned serially
+STORAGE_SCAN_PARALLEL_MIN = 4
+
+# Shared by all storage scans; threads are started on first use
+_storage_scan_executor = ThreadPoolExecutor(
+    max_workers=STORAGE_SCAN_WORKERS,
+    thread_name_prefix="backup-scan",
+)
+
+
+def _scan_app_backup_dir(root_fd: int, name: str) -> Tuple[int, int]:
+    """
+    Sum the size and count of backup archives in one app directory.
+    
+    Returns:
+        Tuple of (size, count).
+    """
+    size = 0
+    count = 0
+    
+    app_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=root_fd)
+    try:
+        with os.scandir(app_fd) as files:
+            for backup_file in files:
+                if (
+                    backup_file.name.endswith(".tar.gz")
+                    and backup_file.is_file(follow_symlinks=False)
+                ):
+                    size += backup_file.stat(follow_symlinks=False).st_size
+                    count += 1
+    finally:
+        os.close(app_fd)
+    
+    return size, count
+
+
+def _scan_backup_storage(
+    backup_dir: Path,
+    skip: Optional[Set[str]] = None,
+) -> Tuple[int, int, Set[str]]:
+    """
+    Sum the size and count of backup archives under the backup directory.
+    
+    Directories are opened once and scanned by file descriptor, so each
+    archive is stat'ed relative to its directory (fstatat) rather than by
+    walking the full path again. When there are several app directories
+    they are scanned in parallel to overlap their I/O waits.
+    
+    Args:
+        backup_dir: Backup root directory.
+        skip: App directories whose totals are already known; they are
+            listed in the returned domains but not scanned.
+    
+    Returns:
+        Tuple of (total_size, backup_count, domains).
+    """
+    root_fd = os.open(backup_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(root_fd) as entries:
+            domains = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+        
+        to_scan = [name for name in domains if not skip or name not in skip]
+        scan = partial(_scan_app_backup_dir, root_fd)
+        if len(to_scan) < STORAGE_SCAN_PARALLEL_MIN:
+            results = [scan(name) for name in to_scan]
+        else:
+            results = list(_storage_scan_executor.map(scan, to_scan))
+    finally:
+        os.close(root_fd)
+    
+    total_size = sum(size for size, _ in results)
+    backup_count = sum(count for _, count in results)
+    
+    return total_size, backup_count, set(domains)
+
+
 class BackupManager:
     """
     Manager for application backups.
@@ -193,6 +503,59 @@ class BackupManager:
             self.config.get("backup.directory", str(self.DEFAULT_BACKUP_DIR))
         )
         self.max_backups = self.config.get("backup.max_per_app", self.DEFAULT_MAX_BACKUPS)
+        self._index: Optional[BackupIndex] = None
+    
+    @property
+    def index(self) -> Optional[BackupIndex]:
+        """
+        Get the backup index.
+        
+        Returns:
+            BackupIndex, or None if the backup directory does not exist
+            or is not writable by this process.
+        """
+        if self._index is None:
+            if not os.access(self.backup_dir, os.W_OK | os.X_OK):
+                return None
+            self._index = BackupIndex(
+                self.backup_dir / BackupIndex.FILENAME,
+                loader=self._scan_backups,
+            )
+        return self._index
+    
+    def _invalidate_index(self) -> None:
+        """Remove the index file so the next reader rebuilds it."""
+        index_file = self.backup_dir / BackupIndex.FILENAME
+        run_command_sudo(["rm", "-f", str(index_file)])
+    
+    def _index_unavailable(self, error: Exception) -> None:
+        """Handle a failed index read before falling back to a scan."""
+        self.logger.debug(f"Backup index unavailable, scanning: {error}")
+        # Remove a broken index so the next reader rebuilds it instead of
+        # every read falling back to a full scan
+        self._invalidate_index()
+    
+    def _index_add(self, metadata: BackupMetadata) -> None:
+        """Record a new backup in the index, invalidating it on failure."""
+        index = self.index
+        try:
+            if index is None:
+                raise PermissionError(f"Backup index not writable: {self.backup_dir}")
+            index.add(metadata)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.debug(f"Could not update backup index: {e}")
+            self._invalidate_index()
+    
+    def _index_remove(self, backup_id: str) -> None:
+        """Remove a backup from the index, invalidating it on failure."""
+        index = self.index
+        try:
+            if index is None:
+                raise PermissionError(f"Backup index not writable: {self.backup_dir}")
+            index.remove(backup_id)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.debug(f"Could not update backup index: {e}")
+            self._invalidate_index()
     
     def _run(self, command: list, cwd=None, env=None, timeout=None):
         """Execute a command."""
@@ -455,6 +818,7 @@ class BackupManager:
 
         run_command_sudo(["mv", str(tmp_meta_path), str(metadata_file)])
         run_command_sudo(["chmod", "644", str(metadata_file)])
+        self._index_add(metadata)
 
         # Rotate backups using policy if specified, otherwise default
         if retention_count is not None or retention_days is not None:
@@ -489,6 +853,80 @@ class BackupManager:
         Returns:
             List of BackupMetadata objects.
         """
+        return list(self.iter_backups(domain=domain, app_name=app_name, tags=tags, limit=limit))
+
+    def iter_backups(
+        self,
+        domain: Optional[str] = None,
+        app_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[BackupMetadata]:
+        """
+        Iterate over backups, newest first.
+
+        Same filters as list_backups(), but backups are read from the index
+        one at a time as the returned iterator is consumed. The index query
+        (or the fallback scan) runs before this returns, so errors surface
+        here rather than midway through iteration.
+
+        Args:
+            domain: Filter by domain (None for all).
+            app_name: Filter by app name directly (alternative to domain).
+            tags: Filter by tags.
+            limit: Maximum number of backups to yield.
+
+        Returns:
+            Iterator of BackupMetadata objects.
+        """
+        if not self.backup_dir.exists():
+            return iter(())
+
+        if not app_name and domain:
+            app_name = domain_to_app_name(domain)
+
+        backups = None
+        index = self.index
+        if index is not None:
+            try:
+                backups = index.iter_query(app_name=app_name, limit=None if tags else limit)
+            except (sqlite3.Error, OSError) as e:
+                self._index_unavailable(e)
+
+        if backups is None:
+            backups = iter(self._scan_backups(app_name))
+
+        return self._filter_backups(backups, tags, limit)
+
+    @staticmethod
+    def _filter_backups(
+        backups: Iterator[BackupMetadata],
+        tags: Optional[List[str]],
+        limit: Optional[int],
+    ) -> Iterator[BackupMetadata]:
+        """Apply the tag filter and limit to a stream of backups."""
+        count = 0
+        for backup in backups:
+            # Filter by tags
+            if tags and not any(tag in backup.tags for tag in tags):
+                continue
+
+            yield backup
+
+            count += 1
+            if limit and count >= limit:
+                break
+
+    def _scan_backups(self, app_name: Optional[str] = None) -> List[BackupMetadata]:
+        """
+        Read backup metadata from the backup directory.
+
+        Args:
+            app_name: Only scan this app's directory (None for all).
+
+        Returns:
+            List of BackupMetadata objects, newest first.
+        """
         backups = []
 
         if not self.backup_dir.exists():
@@ -497,9 +935,6 @@ class BackupManager:
         # Determine which directories to scan
         if app_name:
             dirs_to_scan = [self._get_app_backup_dir(app_name)]
-        elif domain:
-            resolved_app_name = domain_to_app_name(domain)
-            dirs_to_scan = [self._get_app_backup_dir(resolved_app_name)]
         else:
             dirs_to_scan = [d for d in self.backup_dir.iterdir() if d.is_dir()]
         
@@ -521,11 +956,6 @@ class BackupManager:
                         if not result.success:
                             continue
                         
-                        # Filter by tags
-                        if tags:
-                            if not any(tag in metadata.tags for tag in tags):
-                                continue
-                        
                         backups.append(metadata)
                 except Exception as e:
                     self.logger.debug(f"Error reading metadata {metadata_file}: {e}")
@@ -534,9 +964,6 @@ class BackupManager:
         # Sort by creation date (newest first)
         backups.sort(key=lambda b: b.created_at, reverse=True)
         
-        if limit:
-            backups = backups[:limit]
-        
         return backups
     
     def get_backup(self, backup_id: str) -> Optional[BackupMetadata]:
@@ -549,6 +976,16 @@ class BackupManager:
         Returns:
             BackupMetadata or None if not found.
         """
+        if not self.backup_dir.exists():
+            return None
+        
+        index = self.index
+        if index is not None:
+            try:
+                return index.get(backup_id)
+            except (sqlite3.Error, OSError) as e:
+                self._index_unavailable(e)
+        
         # Search all backup directories
         for app_dir in self.backup_dir.iterdir():
             if not app_dir.is_dir():
@@ -788,13 +1225,20 @@ class BackupManager:
         
         backup_file = app_backup_dir / f"{backup_id}.tar.gz"
         metadata_file = app_backup_dir / f"{backup_id}.json"
+        volume_files = [
+            app_backup_dir / Path(v["path"]).name
+            for v in metadata.docker_volume_backups
+            if v.get("path")
+        ]
         
         # Delete files
-        for file_path in [backup_file, metadata_file]:
+        for file_path in [backup_file, metadata_file, *volume_files]:
             result = run_command_sudo(["rm", "-f", str(file_path)])
             if not result.success:
                 self.logger.warning(f"Failed to delete: {file_path}")
         
+        self._index_remove(backup_id)
+        
         self.logger.debug(f"Deleted backup: {backup_id}")
         return True
     
@@ -1073,6 +1517,39 @@ class BackupManager:
         
         return results
     
+    def storage_totals(self) -> Tuple[int, int, Set[str]]:
+        """
+        Get backup storage totals, from the index when available.
+        
+        Directories with no indexed backups (such as the database dump
+        directory) are scanned, so the totals match a full scan. Falls
+        back to scanning everything if the index cannot be read.
+        
+        Returns:
+            Tuple of (total_size, backup_count, domains), where domains
+            are the app backup directory names.
+        """
+        if not self.backup_dir.exists():
+            return 0, 0, set()
+        
+        index = self.index
+        if index is not None:
+            try:
+                rows = index.storage_by_app()
+            except (sqlite3.Error, OSError) as e:
+                self._index_unavailable(e)
+            else:
+                indexed = {row["app_name"] for row in rows}
+                total_size, backup_count, domains = _scan_backup_storage(
+                    self.backup_dir, skip=indexed
+                )
+                for row in rows:
+                    total_size += row["size"]
+                    backup_count += row["count"]
+                return total_size, backup_count, domains
+        
+        return _scan_backup_storage(self.backup_dir)
+    
     def get_storage_usage(self) -> Dict[str, Any]:
         """
         Get backup storage usage statistics.
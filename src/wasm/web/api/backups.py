@@ -4,17 +4,32 @@ Backups API endpoints.
 Provides endpoints for managing application backups.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 
 from fastapi import APIRouter, Request, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from wasm.web.api.auth import get_current_session
-from wasm.managers.backup_manager import BackupManager
+from wasm.managers.backup_manager import BackupManager, BackupMetadata
 
 router = APIRouter()
 
+# Backups encoded per chunk of the streamed backup list
+LIST_STREAM_BATCH_SIZE = 64
+
+# (divisor, unit) pairs indexed by floor(log2(size) / 10)
+SIZE_UNITS = [(1, "B"), (1 << 10, "KB"), (1 << 20, "MB"), (1 << 30, "GB"), (1 << 40, "TB")]
+
+
+def get_backup_manager(request: Request) -> BackupManager:
+    """Get the shared backup manager created at application startup."""
+    return request.app.state.backup_manager
+
 
 class BackupInfo(BaseModel):
     """Backup information."""
@@ -83,82 +98,110 @@ class VerifyBackupResponse(BaseModel):
     message: str
 
 
+def _to_backup_info(backup: BackupMetadata) -> BackupInfo:
+    """
+    Convert backup metadata to the API model.
+    
+    The metadata comes from BackupManager and is already typed, so the
+    model is constructed without validation.
+    """
+    return BackupInfo.model_construct(
+        backup_id=backup.id,
+        domain=backup.domain,
+        timestamp=backup.created_at,
+        size=backup.size_bytes,
+        size_human=backup.size_human,
+        age=backup.age,
+        description=backup.description,
+        app_type=backup.app_type,
+        includes_env=backup.includes_env,
+        includes_node_modules=backup.includes_node_modules,
+        includes_build=backup.includes_build,
+        has_database=backup.includes_databases,
+        database_backups=backup.database_backups,
+        git_commit=backup.git_commit,
+        git_branch=backup.git_branch,
+        tags=backup.tags
+    )
+
+
+def _stream_backup_list(backups: Iterator[BackupMetadata]) -> Iterator[bytes]:
+    """
+    Serialize backups as a BackupListResponse JSON document.
+    
+    Backups are converted and encoded as they are read and sent in
+    chunks of LIST_STREAM_BATCH_SIZE, so the full list is never held in
+    memory and each chunk costs one threadpool hop rather than each row.
+    """
+    total = 0
+    chunk = [b'{"backups":[']
+    for backup in backups:
+        if total:
+            chunk.append(b",")
+        chunk.append(_to_backup_info(backup).model_dump_json().encode())
+        total += 1
+        if total % LIST_STREAM_BATCH_SIZE == 0:
+            yield b"".join(chunk)
+            chunk = []
+    chunk.append(b'],"total":%d}' % total)
+    yield b"".join(chunk)
+
+
 @router.get("", response_model=BackupListResponse)
 async def list_backups(
     request: Request,
     domain: Optional[str] = Query(None, description="Filter by domain"),
     limit: int = Query(100, ge=1, le=1000),
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     List all backups, optionally filtered by domain.
     """
     try:
-        manager = BackupManager(verbose=False)
-        backups_list = manager.list_backups(domain=domain, limit=limit)
-        
-        backups = []
-        for backup in backups_list:
-            backups.append(BackupInfo(
-                backup_id=backup.id,
-                domain=backup.domain,
-                timestamp=backup.created_at,
-                size=backup.size_bytes,
-                size_human=backup.size_human,
-                age=backup.age,
-                description=backup.description,
-                app_type=backup.app_type,
-                includes_env=backup.includes_env,
-                includes_node_modules=backup.includes_node_modules,
-                includes_build=backup.includes_build,
-                has_database=backup.includes_databases,
-                database_backups=backup.database_backups,
-                git_commit=backup.git_commit,
-                git_branch=backup.git_branch,
-                tags=backup.tags
-            ))
-        
-        return BackupListResponse(
-            backups=backups,
-            total=len(backups)
-        )
+        backups = await run_in_threadpool(manager.iter_backups, domain=domain, limit=limit)
+        # Read the first backup up front so failures still produce a 500
+        # instead of a truncated 200 body
+        first = await run_in_threadpool(next, backups, None)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list backups: {e}")
+    
+    if first is not None:
+        backups = chain((first,), backups)
+    
+    # Remaining backups are read and encoded lazily; Starlette consumes sync
+    # iterators in the threadpool so this does not block the event loop
+    return StreamingResponse(_stream_backup_list(backups), media_type="application/json")
 
 
 @router.get("/storage", response_model=BackupStorageResponse)
 async def get_storage_info(
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Get backup storage information.
     """
     try:
-        manager = BackupManager(verbose=False)
         backup_dir = manager.backup_dir
         
-        total_size = 0
-        backup_count = 0
-        domains = set()
+        # Nothing to scan on systems without backups yet
+        if not os.path.isdir(backup_dir):
+            return BackupStorageResponse(
+                path=str(backup_dir),
+                total_size=0,
+                total_size_human="0 B",
+                backup_count=0,
+                domains=[]
+            )
         
-        if backup_dir.exists():
-            for app_dir in backup_dir.iterdir():
-                if app_dir.is_dir():
-                    domains.add(app_dir.name)
-                    for backup_file in app_dir.glob("*.tar.gz"):
-                        total_size += backup_file.stat().st_size
-                        backup_count += 1
+        total_size, backup_count, domains = await run_in_threadpool(manager.storage_totals)
         
-        # Convert size to human readable
-        if total_size >= 1073741824:  # 1 GB
-            size_human = f"{total_size / 1073741824:.2f} GB"
-        elif total_size >= 1048576:  # 1 MB
-            size_human = f"{total_size / 1048576:.2f} MB"
-        elif total_size >= 1024:  # 1 KB
-            size_human = f"{total_size / 1024:.2f} KB"
-        else:
-            size_human = f"{total_size} B"
+        # Convert size to human readable (unit picked from the bit length)
+        unit_index = min(max(0, (total_size.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+        divisor, unit = SIZE_UNITS[unit_index]
+        size_human = f"{total_size / divisor:.2f} {unit}" if unit_index else f"{total_size} B"
         
         return BackupStorageResponse(
             path=str(backup_dir),
@@ -175,36 +218,19 @@ async def get_storage_info(
 async def get_backup(
     backup_id: str,
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Get details for a specific backup.
     """
     try:
-        manager = BackupManager(verbose=False)
-        backup = manager.get_backup(backup_id)
+        backup = await run_in_threadpool(manager.get_backup, backup_id)
         
         if not backup:
             raise HTTPException(status_code=404, detail=f"Backup not found: {backup_id}")
         
-        return BackupInfo(
-            backup_id=backup.id,
-            domain=backup.domain,
-            timestamp=backup.created_at,
-            size=backup.size_bytes,
-            size_human=backup.size_human,
-            age=backup.age,
-            description=backup.description,
-            app_type=backup.app_type,
-            includes_env=backup.includes_env,
-            includes_node_modules=backup.includes_node_modules,
-            includes_build=backup.includes_build,
-            has_database=backup.includes_databases,
-            database_backups=backup.database_backups,
-            git_commit=backup.git_commit,
-            git_branch=backup.git_branch,
-            tags=backup.tags
-        )
+        return _to_backup_info(backup)
     except HTTPException:
         raise
     except Exception as e:
@@ -215,14 +241,13 @@ async def get_backup(
 async def create_backup(
     data: CreateBackupRequest,
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Create a new backup for an application.
     """
     try:
-        manager = BackupManager(verbose=False)
-        
         # Check if app exists
         from wasm.core.config import Config
         from wasm.core.utils import domain_to_app_name
@@ -234,7 +259,8 @@ async def create_backup(
         if not app_path.exists():
             raise HTTPException(status_code=404, detail=f"Application not found: {data.domain}")
         
-        backup_meta = manager.create(
+        backup_meta = await run_in_threadpool(
+            manager.create,
             domain=data.domain,
             description=data.description,
             include_env=data.include_env,
@@ -259,14 +285,14 @@ async def create_backup(
 async def verify_backup(
     backup_id: str,
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Verify a backup's integrity.
     """
     try:
-        manager = BackupManager(verbose=False)
-        result = manager.verify(backup_id)
+        result = await run_in_threadpool(manager.verify, backup_id)
         
         return VerifyBackupResponse(
             backup_id=backup_id,
@@ -284,16 +310,15 @@ async def restore_backup(
     backup_id: str,
     data: RestoreBackupRequest,
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Restore an application from a backup.
     """
     try:
-        manager = BackupManager(verbose=False)
-        
         # Get backup info
-        backup = manager.get_backup(backup_id)
+        backup = await run_in_threadpool(manager.get_backup, backup_id)
         if not backup:
             raise HTTPException(status_code=404, detail=f"Backup not found: {backup_id}")
         
@@ -301,7 +326,8 @@ async def restore_backup(
         target_domain = data.target_domain or backup.domain
 
         # Perform restore
-        success = manager.restore(
+        success = await run_in_threadpool(
+            manager.restore,
             backup_id=backup_id,
             target_domain=target_domain
         )
@@ -324,20 +350,19 @@ async def restore_backup(
 async def delete_backup(
     backup_id: str,
     request: Request,
-    session: dict = Depends(get_current_session)
+    session: dict = Depends(get_current_session),
+    manager: BackupManager = Depends(get_backup_manager),
 ):
     """
     Delete a backup.
     """
     try:
-        manager = BackupManager(verbose=False)
-        
         # Check if backup exists
-        backup = manager.get_backup(backup_id)
+        backup = await run_in_threadpool(manager.get_backup, backup_id)
         if not backup:
             raise HTTPException(status_code=404, detail=f"Backup not found: {backup_id}")
         
-        success = manager.delete(backup_id)
+        success = await run_in_threadpool(manager.delete, backup_id)
         
         if success:
             return BackupActionResponse(
@@ -75,6 +75,8 @@ def get_brute_force() -> BruteForceProtection:
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
+    from wasm.managers.backup_manager import BackupManager
+    app.state.backup_manager = BackupManager(verbose=False)
     yield
     # Shutdown
     pass